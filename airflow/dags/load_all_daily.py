@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timedelta
-from textwrap import dedent
 
 from airflow import DAG
 from airflow.providers.docker.operators.docker import DockerOperator
@@ -36,44 +35,6 @@ ENV_KEYS = [
 
 ENVIRONMENT = {key: value for key in ENV_KEYS if (value := os.environ.get(key))}
 
-QUALITY_CHECK_SCRIPT = dedent(
-    """
-from storage.db import connect
-
-conn = connect(read_only=True)
-counts = {
-    "total": conn.execute("SELECT COUNT(*) FROM market_signals").fetchone()[0],
-    "hud": conn.execute("SELECT COUNT(*) FROM market_signals WHERE source='hud_fmr'").fetchone()[0],
-    "acs": conn.execute("SELECT COUNT(*) FROM market_signals WHERE source='acs'").fetchone()[0],
-    "fred": conn.execute("SELECT COUNT(*) FROM market_signals WHERE source='fred'").fetchone()[0],
-}
-conn.close()
-
-assert counts["total"] > 0, "No rows loaded"
-assert counts["hud"] >= 5, "Unexpected HUD row count"
-assert counts["acs"] >= 4, "Unexpected ACS row count"
-assert counts["fred"] >= 1, "Unexpected FRED row count"
-print(counts)
-    """
-).strip()
-
-RECORD_STATUS_SCRIPT = dedent(
-    """
-from datetime import datetime, timezone
-from storage.db import connect
-
-conn = connect()
-conn.execute(
-    "CREATE TABLE IF NOT EXISTS load_status (status_key TEXT PRIMARY KEY, loaded_at TIMESTAMP)"
-)
-conn.execute(
-    "INSERT OR REPLACE INTO load_status VALUES (?, ?)",
-    ("load_all_daily", datetime.now(timezone.utc)),
-)
-conn.close()
-    """
-).strip()
-
 with DAG(
     dag_id="load_all_daily",
     description="Run jobs.load_all to refresh market signals and record status",
@@ -85,10 +46,12 @@ with DAG(
     tags=["market-signals", "etl"],
 ) as dag:
 
-    load_market_signals = DockerOperator(
-        task_id="load_market_signals",
+    # One container runs load + quality checks + status write in-process
+    # (jobs.load_all_with_checks), avoiding two extra cold starts per run.
+    load_with_checks = DockerOperator(
+        task_id="load_market_signals_with_checks",
         image=API_IMAGE,
-        command=["python", "-m", "jobs.load_all"],
+        command=["python", "-m", "jobs.load_all_with_checks"],
         docker_url="unix://var/run/docker.sock",
         auto_remove=True,
         network_mode=DOCKER_NETWORK,
@@ -97,31 +60,3 @@ with DAG(
         mount_tmp_dir=False,
         do_xcom_push=False,
     )
-
-    data_quality_checks = DockerOperator(
-        task_id="data_quality_checks",
-        image=API_IMAGE,
-        command=["python", "-c", QUALITY_CHECK_SCRIPT],
-        docker_url="unix://var/run/docker.sock",
-        auto_remove=True,
-        network_mode=DOCKER_NETWORK,
-        environment=ENVIRONMENT,
-        mounts=[DATA_MOUNT],
-        mount_tmp_dir=False,
-        do_xcom_push=False,
-    )
-
-    record_status = DockerOperator(
-        task_id="record_last_success",
-        image=API_IMAGE,
-        command=["python", "-c", RECORD_STATUS_SCRIPT],
-        docker_url="unix://var/run/docker.sock",
-        auto_remove=True,
-        network_mode=DOCKER_NETWORK,
-        environment=ENVIRONMENT,
-        mounts=[DATA_MOUNT],
-        mount_tmp_dir=False,
-        do_xcom_push=False,
-    )
-
-    load_market_signals >> data_quality_checks >> record_status
@@ -2,52 +2,143 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import tempfile
 from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, AsyncIterator
 
 import duckdb
+import orjson
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
-from dotenv import load_dotenv
 
-from jobs.config import MarketConfig, get_market_by_key
-from pipelines.model import MarketSignal
-from storage.db import MARKET_SIGNALS_TABLE, connect, fetch_market_signals
+from jobs.config import MarketConfig, get_market_by_key, load_env
+from storage.db import MARKET_SIGNALS_TABLE, connect, get_database_path
 from storage.exports import export_to_csv, export_to_parquet
 
 DEFAULT_LIMIT = 200
 MAX_LIMIT = 2000
 ALLOWED_FORMATS = {"json", "csv", "parquet"}
-load_dotenv()
+POOL_SIZE = 4
+load_env()
 
 
-@asynccontextmanager
-async def lifespan(_: FastAPI):
-    conn = connect()
-    conn.close()
-    yield
+def _db_version() -> tuple[int, int] | None:
+    """Identity of the live database file; changes when the loader swaps it.
 
+    The load job writes through a staging copy and publishes it with an
+    atomic rename (storage.db.write_session), so pooled read-only handles
+    keep the old inode open and must be replaced once the file changes.
+    """
 
-app = FastAPI(title="CRE Market Signals API", version="0.1.0", lifespan=lifespan)
+    try:
+        stat = os.stat(get_database_path())
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
 
 
-def _configure_cors() -> None:
-    raw_origins = os.getenv("API_CORS_ORIGINS", "*")
-    origins = [origin.strip() for origin in raw_origins.split(",") if origin.strip()]
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=origins or ["*"],
-        allow_methods=["*"],
-        allow_headers=["*"],
-        allow_credentials=True,
-    )
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    # Ensure the database file and schema exist before opening read-only handles.
+    conn = connect()
+    conn.close()
+    application.state.conn_pool = [connect(read_only=True) for _ in range(POOL_SIZE)]
+    application.state.conn_semaphore = asyncio.Semaphore(POOL_SIZE)
+    application.state.db_version = _db_version()
+    application.state.refresh_lock = asyncio.Lock()
+    try:
+        yield
+    finally:
+        pool = application.state.conn_pool
+        application.state.conn_pool = []
+        for pooled in pool:
+            pooled.close()
+
+
+async def _refresh_pool() -> None:
+    """Replace every pooled handle after the loader swapped the database file.
+
+    DuckDB caches the database instance per path within a process, so a new
+    connection only attaches to the swapped file once every handle on the
+    old one is closed. Draining all semaphore slots guarantees no request
+    holds an old handle while the pool is rebuilt.
+    """
+
+    async with app.state.refresh_lock:
+        if _db_version() == app.state.db_version:
+            return
+        semaphore = app.state.conn_semaphore
+        for _ in range(POOL_SIZE):
+            await semaphore.acquire()
+        try:
+            for pooled in app.state.conn_pool:
+                pooled.close()
+            app.state.conn_pool = [connect(read_only=True) for _ in range(POOL_SIZE)]
+            app.state.db_version = _db_version()
+        finally:
+            for _ in range(POOL_SIZE):
+                semaphore.release()
 
 
-_configure_cors()
+@asynccontextmanager
+async def acquire_conn() -> AsyncIterator[duckdb.DuckDBPyConnection]:
+    """Borrow a read-only connection from the process-wide pool.
+
+    Each acquire stats the database file first; when the loader has
+    published a new copy, the whole pool is drained and reopened before
+    serving, so no request reads through a handle on the replaced file.
+    """
+
+    if _db_version() != app.state.db_version:
+        await _refresh_pool()
+    async with app.state.conn_semaphore:
+        conn = app.state.conn_pool.pop()
+        try:
+            yield conn
+        finally:
+            app.state.conn_pool.append(conn)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+app = FastAPI(
+    title="CRE Market Signals API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+
+# Origins are resolved once at import; a wildcard (or empty) configuration
+# disables credentials, since Starlette otherwise falls back to reflecting the
+# request origin on every response.
+_CORS_ORIGINS: tuple[str, ...] = tuple(
+    origin.strip()
+    for origin in os.getenv("API_CORS_ORIGINS", "*").split(",")
+    if origin.strip()
+)
+_CORS_WILDCARD = not _CORS_ORIGINS or "*" in _CORS_ORIGINS
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"] if _CORS_WILDCARD else list(_CORS_ORIGINS),
+    allow_methods=["*"],
+    allow_headers=["*"],
+    allow_credentials=not _CORS_WILDCARD,
+)
 
 
 @app.get("/health")
@@ -59,6 +150,8 @@ def _build_filters(
     geo_level: str | None,
     geo_id: str | None,
     metric: str | None,
+    after: datetime | None = None,
+    after_metric: str | None = None,
 ) -> tuple[str | None, list[Any]]:
     filters: list[str] = []
     params: list[Any] = []
@@ -80,6 +173,17 @@ def _build_filters(
     if metric:
         filters.append("metric = ?")
         params.append(metric)
+    if after is not None and after_metric is not None:
+        # Keyset cursor: pages walk backwards through (observed_at, metric),
+        # so each page is an index-bounded scan instead of a deepening
+        # sort+limit. The metric tie-breaker matters because observed_at ties
+        # are the norm here — every HUD/ACS metric for a market-year shares
+        # the same January 1 timestamp.
+        filters.append("(observed_at, metric) < (?, ?)")
+        params.extend((after, after_metric))
+    elif after is not None:
+        filters.append("observed_at < ?")
+        params.append(after)
 
     if not filters:
         return None, params
@@ -87,21 +191,74 @@ def _build_filters(
     return " AND ".join(filters), params
 
 
-def _build_query(where: str | None, limit: int) -> str:
-    sql = f"SELECT * FROM {MARKET_SIGNALS_TABLE}"
+SIGNAL_COLUMNS = (
+    "source",
+    "geo_level",
+    "geo_id",
+    "geo_name",
+    "observed_at",
+    "metric",
+    "value",
+    "unit",
+)
+
+
+@lru_cache(maxsize=32)
+def _build_query(where: str | None, include_raw: bool = False) -> str:
+    """Build the /signals query for a filter shape, with LIMIT as a placeholder.
+
+    Caching on the filter shape keeps the SQL text stable across requests so
+    DuckDB can reuse the parsed statement instead of re-planning per call.
+    Only the columns the response needs are projected; the ``raw_payload``
+    blob often dominates row width and is skipped unless requested.
+    """
+
+    columns = ", ".join(SIGNAL_COLUMNS + ("raw_payload",) if include_raw else SIGNAL_COLUMNS)
+    sql = f"SELECT {columns} FROM {MARKET_SIGNALS_TABLE}"
     if where:
         sql += f" WHERE {where}"
-    sql += " ORDER BY observed_at DESC"
-    sql += f" LIMIT {limit}"
+    sql += " ORDER BY observed_at DESC, metric DESC"
+    sql += " LIMIT ?"
     return sql
 
 
-def _serialize_signals(signals: Sequence[MarketSignal]) -> list[dict[str, Any]]:
-    return [signal.model_dump(mode="json") for signal in signals]
+def _parse_cursor(after: str) -> tuple[datetime, str | None]:
+    """Split an opaque ``next_cursor`` value into its timestamp and metric.
+
+    A bare ISO timestamp (without the ``|metric`` suffix) is still accepted
+    and falls back to timestamp-only filtering.
+    """
+
+    timestamp_text, _, metric_text = after.partition("|")
+    try:
+        timestamp = datetime.fromisoformat(timestamp_text)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor '{after}'.")
+    return timestamp, metric_text or None
+
+
+# orjson.Fragment (3.10+) embeds a pre-serialized payload verbatim; on older
+# orjson fall back to decoding it, trading a re-encode for still working.
+_FRAGMENT = getattr(orjson, "Fragment", None) or orjson.loads
+
+
+def _arrow_items(result: duckdb.DuckDBPyConnection) -> list[dict[str, Any]]:
+    """Materialize query results as plain dicts via Arrow, bypassing Pydantic.
+
+    ``raw_payload`` arrives as a JSON-encoded string from DuckDB; wrapping it in
+    ``orjson.Fragment`` embeds it verbatim instead of double-encoding.
+    """
+
+    items = result.to_arrow_table().to_pylist()
+    for item in items:
+        payload = item.get("raw_payload")
+        if payload is not None:
+            item["raw_payload"] = _FRAGMENT(payload)
+    return items
 
 
 @app.get("/signals")
-def get_signals(
+async def get_signals(
     background_tasks: BackgroundTasks,
     format: str = Query("json", description="Response format: json, csv, or parquet"),
     market: str | None = Query(None, description="Preconfigured market key"),
@@ -109,50 +266,70 @@ def get_signals(
     geo_id: str | None = Query(None, description="Geography identifier (FIPS, CBSA, etc.)"),
     metric: str | None = Query(None, description="Metric identifier to filter"),
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Maximum records returned"),
+    include_raw: bool = Query(False, description="Include the raw upstream payload column"),
+    after: str | None = Query(
+        None,
+        description="Opaque keyset cursor; pass the next_cursor value from the previous page",
+    ),
 ):
     fmt = format.lower()
     if fmt not in ALLOWED_FORMATS:
         raise HTTPException(status_code=400, detail=f"Unsupported format '{format}'.")
 
+    after_ts, after_metric = _parse_cursor(after) if after else (None, None)
+
     where, params = _build_filters(
         market=market,
         geo_level=geo_level,
         geo_id=geo_id,
         metric=metric,
+        after=after_ts,
+        after_metric=after_metric,
     )
 
-    query = _build_query(where, limit)
-
-    conn = connect(read_only=True)
-    try:
-        if fmt == "json":
-            signals = fetch_market_signals(conn, where=where, params=params, limit=limit)
-            payload = {
-                "count": len(signals),
-                "items": _serialize_signals(signals),
-            }
-            return JSONResponse(content=payload)
-
-        suffix = ".csv" if fmt == "csv" else ".parquet"
-        media_type = "text/csv" if fmt == "csv" else "application/vnd.apache.parquet"
-        filename = f"signals{suffix}"
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            dest = Path(tmp.name)
-
-        if fmt == "csv":
-            export_to_csv(conn, dest, query=query, params=params)
-        else:
-            export_to_parquet(conn, dest, query=query, params=params)
-
-        def _cleanup(path: Path) -> None:
-            try:
-                path.unlink()
-            except FileNotFoundError:
-                pass
-
-        background_tasks.add_task(_cleanup, dest)
-        return FileResponse(dest, media_type=media_type, filename=filename, background=background_tasks)
-    except duckdb.Error as exc:  # pragma: no cover - defensive
-        raise HTTPException(status_code=500, detail="Database query failed") from exc
-    finally:
-        conn.close()
+    query = _build_query(where, include_raw)
+    query_params = [*params, limit]
+
+    # DuckDB calls and file exports are synchronous; run them in a worker
+    # thread so a slow query only ties up its pooled connection instead of
+    # stalling the event loop for every other request.
+    async with acquire_conn() as conn:
+        try:
+            if fmt == "json":
+                items = await asyncio.to_thread(
+                    lambda: _arrow_items(conn.execute(query, query_params))
+                )
+                next_cursor = (
+                    f"{items[-1]['observed_at'].isoformat()}|{items[-1]['metric']}"
+                    if len(items) == limit
+                    else None
+                )
+                return ORJSONResponse(
+                    {"count": len(items), "items": items, "next_cursor": next_cursor}
+                )
+
+            suffix = ".csv" if fmt == "csv" else ".parquet"
+            media_type = "text/csv" if fmt == "csv" else "application/vnd.apache.parquet"
+            filename = f"signals{suffix}"
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                dest = Path(tmp.name)
+
+            if fmt == "csv":
+                await asyncio.to_thread(
+                    export_to_csv, conn, dest, query=query, params=query_params
+                )
+            else:
+                await asyncio.to_thread(
+                    export_to_parquet, conn, dest, query=query, params=query_params
+                )
+
+            def _cleanup(path: Path) -> None:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+            background_tasks.add_task(_cleanup, dest)
+            return FileResponse(dest, media_type=media_type, filename=filename, background=background_tasks)
+        except duckdb.Error as exc:  # pragma: no cover - defensive
+            raise HTTPException(status_code=500, detail="Database query failed") from exc
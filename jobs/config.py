@@ -5,6 +5,23 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable
 
+from dotenv import load_dotenv
+
+_ENV_LOADED = False
+
+
+def load_env() -> None:
+    """Load the .env file at most once per process.
+
+    Both the API and the batch jobs import modules that want dotenv loaded;
+    guarding here avoids re-reading the file on every module import.
+    """
+
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
+
 
 @dataclass(frozen=True)
 class MarketConfig:
@@ -75,22 +92,19 @@ TARGET_MARKETS: tuple[MarketConfig, ...] = (
 )
 
 
+_MARKETS_BY_KEY: dict[str, MarketConfig] = {market.key: market for market in TARGET_MARKETS}
+
+
 def get_market_by_key(key: str) -> MarketConfig | None:
-    for market in TARGET_MARKETS:
-        if market.key == key:
-            return market
-    return None
+    return _MARKETS_BY_KEY.get(key)
 
 
 def iter_markets(keys: Iterable[str] | None = None) -> Iterable[MarketConfig]:
     if keys is None:
         return TARGET_MARKETS
-    selected = []
-    for key in keys:
-        market = get_market_by_key(key)
-        if market:
-            selected.append(market)
-    return tuple(selected)
+    return tuple(
+        market for key in keys if (market := _MARKETS_BY_KEY.get(key)) is not None
+    )
 
 
-__all__ = ["MarketConfig", "TARGET_MARKETS", "get_market_by_key", "iter_markets"]
+__all__ = ["MarketConfig", "TARGET_MARKETS", "get_market_by_key", "iter_markets", "load_env"]
@@ -5,18 +5,18 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+from functools import lru_cache
 from typing import Iterable
 
-from dotenv import load_dotenv
-
+from pipelines.common import aclose_client
 from pipelines.sources.acs import fetch_acs
 from pipelines.sources.fred import FredSeriesConfig, fetch_fred_series
 from pipelines.sources.hud_fmr import fetch_hud_fmr
-from pipelines.model import MarketSignal
-from storage.db import connect, upsert_market_signals
-from jobs.config import MarketConfig, TARGET_MARKETS, iter_markets
+from pipelines.model import MarketSignal, RawSignal
+from storage.db import upsert_market_signals, write_session
+from jobs.config import MarketConfig, TARGET_MARKETS, iter_markets, load_env
 
-load_dotenv()
+load_env()
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,9 @@ DEFAULT_FRED_SERIES_ID_ENV = "FRED_SERIES_ID"
 DEFAULT_FRED_METRIC_ENV = "FRED_SERIES_METRIC"
 DEFAULT_FRED_UNIT_ENV = "FRED_SERIES_UNIT"
 
+# Cap on concurrently fetched markets so we do not flood upstream APIs.
+MARKET_FETCH_CONCURRENCY = 8
+
 
 def _parse_geo(raw: str) -> tuple[str, str]:
     try:
@@ -42,30 +45,19 @@ def _split_fips(geo_id: str) -> tuple[str, str | None]:
     return geo_id, None
 
 
-async def _gather_signals_for_market(market: MarketConfig) -> list[MarketSignal]:
-    state_fips, county_fips = _split_fips(market.geo_id)
-
-    collected: list[MarketSignal] = []
+async def _gather_signals_for_market(market: MarketConfig) -> list[RawSignal]:
+    """Fetch HUD and FRED signals for one market (ACS is batched per state)."""
 
+    tasks = []
     for year in market.years:
-        collected.extend(
-            await fetch_hud_fmr(
+        tasks.append(
+            fetch_hud_fmr(
                 entity_id=market.geo_id,
                 geo_level=market.geo_level,
                 year=year,
             )
         )
 
-        collected.extend(
-            await fetch_acs(
-                year=year,
-                state_fips=state_fips,
-                county_fips=county_fips,
-                geo_level=market.geo_level,
-            )
-        )
-
-    fred_signals: list[MarketSignal] = []
     if market.fred_series_id:
         fred_config = FredSeriesConfig(
             series_id=market.fred_series_id,
@@ -75,20 +67,64 @@ async def _gather_signals_for_market(market: MarketConfig) -> list[MarketSignal]
             geo_id=market.geo_id,
             geo_name=market.geo_name,
         )
-        fred_signals = await fetch_fred_series(
-            fred_config,
-            observation_start=market.fred_observation_start
-            or f"{market.start_year}-01-01",
-            observation_end=market.fred_observation_end
-            or f"{market.end_year}-12-31",
+        tasks.append(
+            fetch_fred_series(
+                fred_config,
+                observation_start=market.fred_observation_start
+                or f"{market.start_year}-01-01",
+                observation_end=market.fred_observation_end
+                or f"{market.end_year}-12-31",
+            )
         )
     else:
         logger.info("Skipping FRED load for %s (no series configured).", market.key)
 
-    return [*collected, *fred_signals]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    collected: list[RawSignal] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning("Signal fetch failed for %s: %s", market.key, result)
+            continue
+        collected.extend(result)
+    return collected
+
+
+def _group_acs_requests(
+    markets: Iterable[MarketConfig],
+) -> dict[tuple[int, str, str], set[str | None]]:
+    """Group markets into one ACS request per (year, geo_level, state)."""
+
+    groups: dict[tuple[int, str, str], set[str | None]] = {}
+    for market in markets:
+        state_fips, county_fips = _split_fips(market.geo_id)
+        for year in market.years:
+            groups.setdefault((year, market.geo_level, state_fips), set()).add(county_fips)
+    return groups
+
+
+async def _gather_acs_group(
+    year: int, geo_level: str, state_fips: str, counties: set[str | None]
+) -> list[MarketSignal]:
+    county_fips = sorted(county for county in counties if county)
+    try:
+        return await fetch_acs(
+            year=year,
+            state_fips=state_fips,
+            county_fips=county_fips or None,
+            geo_level=geo_level,
+        )
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning(
+            "ACS fetch failed for state=%s year=%s: %s", state_fips, year, exc
+        )
+        return []
+
 
+@lru_cache(maxsize=1)
+def _markets_from_env() -> tuple[MarketConfig, ...] | None:
+    """Parse the DEFAULT_GEO-based market override once per process."""
 
-def _markets_from_env() -> list[MarketConfig] | None:
     default_geo = os.getenv("DEFAULT_GEO")
     if not default_geo:
         return None
@@ -106,7 +142,7 @@ def _markets_from_env() -> list[MarketConfig] | None:
     fred_observation_start = os.getenv("FRED_OBSERVATION_START")
     fred_observation_end = os.getenv("FRED_OBSERVATION_END")
 
-    return [
+    return (
         MarketConfig(
             key=os.getenv("DEFAULT_MARKET_KEY", "env_default"),
             geo_level=geo_level,
@@ -119,14 +155,14 @@ def _markets_from_env() -> list[MarketConfig] | None:
             fred_unit=fred_unit,
             fred_observation_start=fred_observation_start,
             fred_observation_end=fred_observation_end,
-        )
-    ]
+        ),
+    )
 
 
 def _resolve_markets() -> tuple[MarketConfig, ...]:
     env_markets = _markets_from_env()
     if env_markets:
-        return tuple(env_markets)
+        return env_markets
 
     requested = os.getenv("LOAD_MARKETS")
     if requested:
@@ -147,11 +183,39 @@ async def load_all_async(markets: Iterable[MarketConfig] | None = None) -> int:
 
     markets = tuple(markets) if markets is not None else _resolve_markets()
     total_written = 0
-    conn = connect()
-    try:
-        for market in markets:
+
+    semaphore = asyncio.Semaphore(MARKET_FETCH_CONCURRENCY)
+
+    async def _fetch_market(market: MarketConfig) -> list[RawSignal]:
+        async with semaphore:
             logger.info("Fetching signals for %s (%s)...", market.geo_name, market.key)
-            signals = await _gather_signals_for_market(market)
+            return await _gather_signals_for_market(market)
+
+    async def _fetch_acs_group(
+        year: int, geo_level: str, state_fips: str, counties: set[str | None]
+    ) -> list[MarketSignal]:
+        async with semaphore:
+            return await _gather_acs_group(year, geo_level, state_fips, counties)
+
+    acs_groups = _group_acs_requests(markets)
+    try:
+        fetched = await asyncio.gather(
+            *(_fetch_market(market) for market in markets),
+            *(
+                _fetch_acs_group(year, geo_level, state_fips, counties)
+                for (year, geo_level, state_fips), counties in acs_groups.items()
+            ),
+        )
+    finally:
+        await aclose_client()
+
+    market_batches = fetched[: len(markets)]
+    acs_batches = fetched[len(markets):]
+
+    # write_session stages writes in a private copy and swaps it in on
+    # success, so the load never contends with the API's read-only pool.
+    with write_session() as conn:
+        for market, signals in zip(markets, market_batches, strict=True):
             if not signals:
                 logger.warning("No signals fetched for %s; skipping write.", market.key)
                 continue
@@ -160,9 +224,15 @@ async def load_all_async(markets: Iterable[MarketConfig] | None = None) -> int:
                 "Persisted %s records for %s.", written, market.key
             )
             total_written += written
-        return total_written
-    finally:
-        conn.close()
+        for (year, _, state_fips), signals in zip(acs_groups, acs_batches, strict=True):
+            if not signals:
+                continue
+            written = upsert_market_signals(conn, signals)
+            logger.info(
+                "Persisted %s ACS records for state %s year %s.", written, state_fips, year
+            )
+            total_written += written
+    return total_written
 
 
 def main(markets: Iterable[MarketConfig] | None = None) -> int:
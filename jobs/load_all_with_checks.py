@@ -0,0 +1,74 @@
+"""Single-process job: load all market signals, verify counts, record status.
+
+Running the load, the data-quality checks, and the status write in one
+invocation lets the Airflow DAG start a single container instead of three.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from jobs.load_all import main as run_load_all
+from storage.db import MARKET_SIGNALS_TABLE, connect, write_session
+
+logger = logging.getLogger(__name__)
+
+# Minimum per-source row counts a healthy load is expected to produce.
+MIN_EXPECTED_COUNTS = {
+    "total": 1,
+    "hud_fmr": 5,
+    "acs": 4,
+    "fred": 1,
+}
+
+
+def run_quality_checks() -> dict[str, int]:
+    """Verify per-source row counts, raising if any fall below the floor."""
+
+    conn = connect(read_only=True)
+    try:
+        row = conn.execute(
+            f"""
+            SELECT COUNT(*),
+                   COUNT(*) FILTER (WHERE source = 'hud_fmr'),
+                   COUNT(*) FILTER (WHERE source = 'acs'),
+                   COUNT(*) FILTER (WHERE source = 'fred')
+            FROM {MARKET_SIGNALS_TABLE}
+            """
+        ).fetchone()
+    finally:
+        conn.close()
+
+    counts = dict(zip(("total", "hud_fmr", "acs", "fred"), row))
+    for key, minimum in MIN_EXPECTED_COUNTS.items():
+        if counts[key] < minimum:
+            raise RuntimeError(
+                f"Quality check failed: {key} count {counts[key]} below expected {minimum}."
+            )
+    return counts
+
+
+def record_last_success(status_key: str = "load_all_daily") -> None:
+    """Persist the last successful run timestamp for monitoring."""
+
+    with write_session() as conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS load_status (status_key TEXT PRIMARY KEY, loaded_at TIMESTAMP)"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO load_status VALUES (?, ?)",
+            (status_key, datetime.now(timezone.utc)),
+        )
+
+
+def main() -> int:
+    run_load_all()
+    counts = run_quality_checks()
+    logger.info("Quality checks passed: %s", counts)
+    record_last_success()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
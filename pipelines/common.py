@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
 from typing import Any, Mapping, MutableMapping
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+# FRED and HUD responses run to multiple megabytes; orjson parses the raw
+# bytes several times faster than the stdlib decoder httpx would use.
+try:
+    from orjson import loads as _loads_json
+except ImportError:  # pragma: no cover - stdlib fallback
+    from json import loads as _loads_json
 
 DEFAULT_TIMEOUT_SECONDS = 30.0
-_DEFAULT_WAIT = wait_exponential(min=1, max=16)
-_DEFAULT_STOP = stop_after_attempt(5)
+MAX_ATTEMPTS = 5
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_BACKOFF_CAP_SECONDS = 16.0
+_TRANSPORT_RETRIES = 3
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+_client: httpx.AsyncClient | None = None
 
 
 Headers = Mapping[str, str] | None
@@ -18,7 +31,35 @@ Data = MutableMapping[str, Any] | bytes | str | None
 JsonData = Any
 
 
-@retry(wait=_DEFAULT_WAIT, stop=_DEFAULT_STOP, reraise=True)
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    A single client keeps TLS sessions and HTTP/2 connections alive across the
+    repeated HUD/ACS/FRED calls an ingestion run makes to the same hosts.
+    """
+
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=_CLIENT_LIMITS,
+                retries=_TRANSPORT_RETRIES,
+            ),
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client, releasing pooled connections."""
+
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 async def fetch_json(
     url: str,
     *,
@@ -31,14 +72,17 @@ async def fetch_json(
 ) -> Any:
     """Execute an HTTP request and return the decoded JSON payload.
 
-    Retries with exponential backoff when transient failures occur. The helper keeps
-    the interface close to ``httpx.AsyncClient.request`` so downstream ingestors can
-    forward API-specific requirements (headers, params, JSON body, etc.) without
-    reimplementing networking concerns.
+    Connection-level failures are retried by the shared transport; 429 and 5xx
+    responses are retried here with jittered exponential backoff so callers do
+    not hammer an API that is already struggling. The helper keeps the
+    interface close to ``httpx.AsyncClient.request`` so downstream ingestors
+    can forward API-specific requirements (headers, params, JSON body, etc.)
+    without reimplementing networking concerns.
     """
 
     request_method = method.upper()
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    client = get_client()
+    for attempt in range(MAX_ATTEMPTS):
         response = await client.request(
             request_method,
             url,
@@ -46,10 +90,14 @@ async def fetch_json(
             params=params,
             data=data,
             json=json,
+            timeout=timeout,
         )
-
-    response.raise_for_status()
-    return response.json()
+        if response.status_code in _RETRYABLE_STATUS and attempt < MAX_ATTEMPTS - 1:
+            delay = min(_BACKOFF_CAP_SECONDS, 2.0**attempt) * random.uniform(0.5, 1.5)
+            await asyncio.sleep(delay)
+            continue
+        response.raise_for_status()
+        return _loads_json(response.content)
 
 
-__all__ = ["fetch_json", "DEFAULT_TIMEOUT_SECONDS"]
+__all__ = ["fetch_json", "get_client", "aclose_client", "DEFAULT_TIMEOUT_SECONDS"]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any
 
-from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class MarketSignal(BaseModel):
@@ -36,7 +37,7 @@ class MarketSignal(BaseModel):
     unit: str = Field(
         ..., description="Measurement unit associated with the value (e.g. 'USD', '%')."
     )
-    raw_payload: Optional[Any] = Field(
+    raw_payload: Any | None = Field(
         default=None,
         description="Raw upstream payload segment retained for traceability and debugging.",
     )
@@ -49,3 +50,37 @@ class MarketSignal(BaseModel):
     @field_serializer("observed_at", when_used="json")
     def _serialize_observed_at(self, value: datetime) -> str:
         return value.isoformat()
+
+
+@dataclass(slots=True)
+class RawSignal:
+    """Lightweight ingest-side counterpart of ``MarketSignal``.
+
+    Bulk ingestors coerce every field before construction, so building a
+    pydantic model per row buys nothing; a slots dataclass is several times
+    cheaper to allocate and smaller in memory. Storage reads both shapes by
+    attribute name, and ``to_model`` converts at API boundaries.
+    """
+
+    source: str
+    geo_level: str
+    geo_id: str
+    geo_name: str
+    observed_at: datetime
+    metric: str
+    value: float
+    unit: str
+    raw_payload: Any | None = None
+
+    def to_model(self) -> MarketSignal:
+        return MarketSignal.model_construct(
+            source=self.source,
+            geo_level=self.geo_level,
+            geo_id=self.geo_id,
+            geo_name=self.geo_name,
+            observed_at=self.observed_at,
+            metric=self.metric,
+            value=self.value,
+            unit=self.unit,
+            raw_payload=self.raw_payload,
+        )
@@ -9,8 +9,10 @@ from __future__ import annotations
 import logging
 import os
 from datetime import datetime
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
+import pyarrow as pa
+import pyarrow.compute as pc
 from httpx import HTTPStatusError
 
 from pipelines.common import fetch_json
@@ -31,34 +33,76 @@ ACS_DEFAULT_VARIABLES: Mapping[str, tuple[str, str]] = {
 }
 
 _SENTINEL_STRINGS = {"", "N/A", "NA", "null", "Null", "-"}
-_SENTINEL_NUMBERS = {"-666666666", "-888888888", "-999999999"}
+# Census annotation codes compared numerically after the float cast, so
+# variants like "-666666666.0" are caught as well.
+_NUMERIC_SENTINELS: frozenset[float] = frozenset({-666666666.0, -888888888.0, -999999999.0})
+_SENTINEL_STRING_ARRAY = pa.array(sorted(_SENTINEL_STRINGS))
+_NUMERIC_SENTINEL_ARRAY = pa.array(sorted(_NUMERIC_SENTINELS), type=pa.float64())
+
+# Retaining the full upstream row on every signal multiplies memory by the
+# variable count; keep it opt-in for debugging runs.
+_INCLUDE_RAW = os.getenv("ACS_INCLUDE_RAW", "0") == "1"
 
 
 def _resolve_api_key(api_key: str | None) -> str | None:
     return api_key or os.getenv("CENSUS_API_KEY")
 
 
+def _coerce_column(raw_column: tuple[Any, ...]) -> list[float | None]:
+    """Coerce one variable column to floats with Arrow compute kernels.
+
+    Sentinel masking and the float cast run as vectorized C++ kernels; the
+    per-cell Python path is kept as a fallback for columns Arrow cannot cast
+    (mixed types or unexpected garbage values).
+    """
+
+    try:
+        arr = pa.array(raw_column, type=pa.string())
+        mask = pc.is_in(arr, value_set=_SENTINEL_STRING_ARRAY)
+        cleaned = pc.if_else(mask, pa.nulls(len(arr), pa.string()), arr)
+        values = pc.cast(cleaned, pa.float64(), safe=False)
+        sentinel_mask = pc.is_in(values, value_set=_NUMERIC_SENTINEL_ARRAY)
+        return pc.if_else(sentinel_mask, pa.nulls(len(arr), pa.float64()), values).to_pylist()
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return [_coerce_numeric(value) for value in raw_column]
+
+
 def _coerce_numeric(value: Any) -> float | None:
     if value is None:
         return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    if not isinstance(value, str):
-        return None
-    if value in _SENTINEL_STRINGS or value in _SENTINEL_NUMBERS:
-        return None
-    try:
-        return float(value)
-    except ValueError:
+    if type(value) in (int, float):
+        numeric = float(value)
+    elif isinstance(value, str):
+        if value in _SENTINEL_STRINGS:
+            return None
+        try:
+            numeric = float(value)
+        except ValueError:
+            return None
+    else:
         return None
+    return None if numeric in _NUMERIC_SENTINELS else numeric
+
 
+def _normalize_counties(county_fips: str | Sequence[str] | None) -> tuple[str, ...]:
+    if county_fips is None:
+        return ()
+    if isinstance(county_fips, str):
+        return (county_fips,)
+    return tuple(county_fips)
 
-def _build_geo_params(geo_level: str, state_fips: str, county_fips: str | None) -> Mapping[str, str]:
+
+def _build_geo_params(
+    geo_level: str, state_fips: str, county_fips: str | Sequence[str] | None
+) -> Mapping[str, str]:
     if geo_level == "county":
-        if not county_fips:
+        counties = _normalize_counties(county_fips)
+        if not counties:
             raise ValueError("county_fips is required when geo_level='county'.")
+        # The Census API accepts a comma-separated county list, so multiple
+        # counties in a state cost one round-trip instead of one each.
         return {
-            "for": f"county:{county_fips}",
+            "for": f"county:{','.join(sorted(counties))}",
             "in": f"state:{state_fips}",
         }
     if geo_level == "state":
@@ -66,11 +110,14 @@ def _build_geo_params(geo_level: str, state_fips: str, county_fips: str | None)
     raise ValueError(f"Unsupported geo_level '{geo_level}'.")
 
 
-def _build_geo_metadata(geo_level: str, state_fips: str, county_fips: str | None) -> tuple[str, str]:
+def _build_geo_metadata(
+    geo_level: str, state_fips: str, county_fips: str | Sequence[str] | None
+) -> tuple[str, str]:
     if geo_level == "county":
-        if not county_fips:
+        counties = _normalize_counties(county_fips)
+        if not counties:
             raise ValueError("county_fips is required when geo_level='county'.")
-        return "county", f"{state_fips}-{county_fips}"
+        return "county", f"{state_fips}-{counties[0]}"
     if geo_level == "state":
         return "state", state_fips
     raise ValueError(f"Unsupported geo_level '{geo_level}'.")
@@ -80,7 +127,7 @@ async def fetch_acs(
     *,
     year: int,
     state_fips: str,
-    county_fips: str | None = None,
+    county_fips: str | Sequence[str] | None = None,
     geo_level: str = "county",
     dataset: str = ACS_DEFAULT_DATASET,
     variables: Mapping[str, tuple[str, str]] = ACS_DEFAULT_VARIABLES,
@@ -142,32 +189,74 @@ async def fetch_acs(
     observed_at = datetime(year, 1, 1)
     geo_level_normalized, geo_id = _build_geo_metadata(geo_level, state_fips, county_fips)
 
+    # Resolve each variable to its column index once instead of rebuilding a
+    # header -> value dict for every row.
+    name_idx = header_row.index("NAME") if "NAME" in header_row else None
+    variable_columns = [
+        (header_row.index(variable), variable, metric, unit)
+        for variable, (metric, unit) in variables.items()
+        if variable in header_row
+    ]
+
+    rows = [
+        row
+        for row in data_rows
+        if isinstance(row, list) and len(row) == len(header_row)
+    ]
+    if not rows:
+        return []
+
+    # Transpose to columns so sentinel masking and float casts run as Arrow
+    # kernels over whole columns instead of Python branches per cell.
+    columns = list(zip(*rows))
+    geo_names = (
+        [name or geo_id for name in columns[name_idx]]
+        if name_idx is not None
+        else [geo_id] * len(rows)
+    )
+    # Batched county requests return one row per county; recover each row's
+    # geography from the trailing state/county columns when present.
+    state_idx = header_row.index("state") if "state" in header_row else None
+    county_idx = header_row.index("county") if "county" in header_row else None
+    if geo_level == "county" and state_idx is not None and county_idx is not None:
+        geo_ids = [f"{state}-{county}" for state, county in zip(columns[state_idx], columns[county_idx])]
+    else:
+        geo_ids = [geo_id] * len(rows)
+    # One shared dict per row; each signal's payload references it instead of
+    # carrying its own copy. (A MappingProxyType would make the sharing
+    # explicit but is not JSON-serializable downstream.)
+    shared_rows = (
+        [dict(zip(header_row, row, strict=False)) for row in rows]
+        if _INCLUDE_RAW
+        else None
+    )
+
     signals: list[MarketSignal] = []
-    for row in data_rows:
-        if not isinstance(row, list) or len(row) != len(header_row):
-            continue
-        row_dict = dict(zip(header_row, row, strict=False))
-        geo_name = row_dict.get("NAME") or geo_id
-
-        for variable, (metric, unit) in variables.items():
-            value = _coerce_numeric(row_dict.get(variable))
+    for idx, variable, metric, unit in variable_columns:
+        raw_column = columns[idx]
+        for row_idx, value in enumerate(_coerce_column(raw_column)):
             if value is None:
                 continue
+            raw_payload = (
+                {
+                    "variable": variable,
+                    "value": raw_column[row_idx],
+                    "raw": shared_rows[row_idx],
+                }
+                if shared_rows is not None
+                else None
+            )
             signals.append(
                 MarketSignal(
                     source="acs",
                     geo_level=geo_level_normalized,
-                    geo_id=geo_id,
-                    geo_name=geo_name,
+                    geo_id=geo_ids[row_idx],
+                    geo_name=geo_names[row_idx],
                     observed_at=observed_at,
                     metric=metric,
                     value=value,
                     unit=unit,
-                    raw_payload={
-                        "variable": variable,
-                        "value": row_dict.get(variable),
-                        "raw": row_dict,
-                    },
+                    raw_payload=raw_payload,
                 )
             )
 
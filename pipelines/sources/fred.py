@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import math
 import os
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
+
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from pipelines.common import fetch_json
-from pipelines.model import MarketSignal
+from pipelines.model import RawSignal
 
 FRED_BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 
 
 @dataclass(frozen=True)
 class FredSeriesConfig:
-    """Metadata needed to normalize a FRED series into ``MarketSignal`` rows."""
+    """Metadata needed to normalize a FRED series into signal rows."""
 
     series_id: str
     metric: str
@@ -28,6 +31,7 @@ class FredSeriesConfig:
 
 
 _SENTINEL_VALUES = {".", "NA", "N/A", ""}
+_SENTINEL_ARRAY = pa.array(sorted(_SENTINEL_VALUES))
 
 logger = logging.getLogger(__name__)
 
@@ -41,22 +45,50 @@ def _resolve_api_key(api_key: str | None) -> str | None:
     return resolved
 
 
+# FRED observation dates are always YYYY-MM-DD, which fromisoformat parses
+# in C; this is the per-cell fallback when the Arrow kernel cannot handle a
+# column, mirroring _coerce_float on the value side.
+_FROMISO = datetime.fromisoformat
+
+
 def _parse_observation_date(raw_date: str) -> datetime | None:
     try:
-        return datetime.fromisoformat(raw_date)
+        return _FROMISO(raw_date)
     except ValueError:
+        return None
+
+
+# Observation dates repeat heavily: every monthly series shares the same few
+# hundred strings, and multi-series jobs re-fetch overlapping ranges. Parsing
+# each distinct string once and memoizing the result keeps the Arrow kernel
+# working only on dates the process has never seen.
+_DATE_CACHE: dict[str, datetime | None] = {}
+_DATE_CACHE_MAX = 8192
+
+
+def _parse_dates(raw_dates: list[str]) -> list[datetime | None]:
+    cache = _DATE_CACHE
+    unseen = sorted({raw for raw in raw_dates if raw not in cache})
+    if unseen:
+        if len(cache) + len(unseen) > _DATE_CACHE_MAX:
+            cache.clear()
         try:
-            return datetime.strptime(raw_date, "%Y-%m-%d")
-        except ValueError:
-            return None
+            parsed = pc.strptime(
+                pa.array(unseen), format="%Y-%m-%d", unit="us", error_is_null=True
+            ).to_pylist()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            parsed = [_parse_observation_date(raw) for raw in unseen]
+        cache.update(zip(unseen, parsed, strict=True))
+    return [cache[raw] for raw in raw_dates]
+
+
+_INF = float("inf")
 
 
 def _coerce_float(value: Any) -> float | None:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        numeric = float(value)
-    elif isinstance(value, str):
+    # FRED serializes observation values as JSON strings, so test that case
+    # first; the concrete type check skips subclass dispatch on the hot path.
+    if type(value) is str:
         stripped = value.strip()
         if stripped in _SENTINEL_VALUES:
             return None
@@ -64,14 +96,46 @@ def _coerce_float(value: Any) -> float | None:
             numeric = float(stripped)
         except ValueError:
             return None
+    elif isinstance(value, (int, float)):
+        numeric = float(value)
     else:
         return None
 
-    if math.isnan(numeric) or math.isinf(numeric):
+    # NaN is the only float unequal to itself; comparing beats a math call.
+    if numeric != numeric or numeric == _INF or numeric == -_INF:
         return None
     return numeric
 
 
+def _normalize_observations(
+    records: list[Mapping[str, Any]],
+) -> tuple[list[datetime | None], list[float | None]]:
+    """Convert observation dates and values to typed columns in one pass.
+
+    Date parsing and value coercion run as Arrow kernels over whole columns;
+    rows that fail either conversion come back as None and are skipped by the
+    caller. Columns Arrow cannot cast fall back to the per-cell helpers.
+    """
+
+    raw_dates = [str(obs.get("date", "")) for obs in records]
+    raw_values = [obs.get("value") for obs in records]
+
+    dates = _parse_dates(raw_dates)
+
+    try:
+        arr = pa.array(raw_values, type=pa.string())
+        mask = pc.is_in(arr, value_set=_SENTINEL_ARRAY)
+        cleaned = pc.if_else(mask, pa.nulls(len(arr), pa.string()), arr)
+        casted = pc.cast(cleaned, pa.float64(), safe=False)
+        values = pc.if_else(
+            pc.is_finite(casted), casted, pa.nulls(len(arr), pa.float64())
+        ).to_pylist()
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        values = [_coerce_float(value) for value in raw_values]
+
+    return dates, values
+
+
 async def fetch_fred_series(
     config: FredSeriesConfig,
     *,
@@ -79,7 +143,7 @@ async def fetch_fred_series(
     observation_start: str | None = None,
     observation_end: str | None = None,
     params: Mapping[str, Any] | None = None,
-) -> list[MarketSignal]:
+) -> list[RawSignal]:
     """Fetch observations for a configured FRED series and normalize them."""
 
     resolved_key = _resolve_api_key(api_key)
@@ -99,22 +163,25 @@ async def fetch_fred_series(
 
     payload = await fetch_json(FRED_BASE_URL, params=request_params)
 
-    observations = payload.get("observations") if isinstance(payload, Mapping) else None
+    observations = payload.get("observations") if isinstance(payload, dict) else None
     if not isinstance(observations, list):
         return []
 
-    signals: list[MarketSignal] = []
-    for obs in observations:
-        if not isinstance(obs, Mapping):
-            continue
-        observed_at = _parse_observation_date(str(obs.get("date", "")))
-        if not observed_at:
-            continue
-        value = _coerce_float(obs.get("value"))
-        if value is None:
+    # The JSON decoder only yields plain dicts; the concrete check skips the ABC.
+    records = [obs for obs in observations if isinstance(obs, dict)]
+    if not records:
+        return []
+
+    dates, values = _normalize_observations(records)
+
+    signals: list[RawSignal] = []
+    for obs, observed_at, value in zip(records, dates, values, strict=True):
+        if observed_at is None or value is None:
             continue
         signals.append(
-            MarketSignal(
+            # Fields are already typed by the normalization above; the slots
+            # dataclass skips pydantic construction entirely.
+            RawSignal(
                 source="fred",
                 geo_level=config.geo_level,
                 geo_id=config.geo_id,
@@ -130,4 +197,25 @@ async def fetch_fred_series(
     return signals
 
 
-__all__ = ["FredSeriesConfig", "fetch_fred_series", "FRED_BASE_URL"]
+async def fetch_fred_series_many(
+    configs: Iterable[FredSeriesConfig],
+    *,
+    concurrency: int = 8,
+    **kwargs: Any,
+) -> list[list[RawSignal]]:
+    """Fetch several FRED series concurrently under a concurrency cap.
+
+    Keyword arguments are forwarded to ``fetch_fred_series``; results come
+    back in the order the configs were given.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(config: FredSeriesConfig) -> list[RawSignal]:
+        async with semaphore:
+            return await fetch_fred_series(config, **kwargs)
+
+    return await asyncio.gather(*(_one(config) for config in configs))
+
+
+__all__ = ["FredSeriesConfig", "fetch_fred_series", "fetch_fred_series_many", "FRED_BASE_URL"]
@@ -1,24 +1,28 @@
 """HUD Fair Market Rent ingestor.
 
-Turns HUD API responses into normalized ``MarketSignal`` records that downstream
+Turns HUD API responses into normalized signal records that downstream
 pipelines can persist or serve.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
 from datetime import datetime, UTC
+from functools import lru_cache
 from typing import Any, Iterable, Mapping
 
 from httpx import HTTPStatusError
 
 from pipelines.common import fetch_json
-from pipelines.model import MarketSignal
+from pipelines.model import RawSignal
 
 HUD_FMR_BASE_URL = "https://www.huduser.gov/hudapi/public/fmr/data"
 
+_NON_DIGIT = re.compile(r"\D")
+
 # Canonical metric -> (HUD field name in flat shape, unit)
 HUD_FMR_FIELDS: Mapping[str, tuple[str, str]] = {
     "fmr_0br": ("fmr_0br", "USD"),
@@ -37,6 +41,10 @@ HUD_BASICDATA_FIELDS: Mapping[str, tuple[str, str]] = {
     "Four-Bedroom": ("fmr_4br", "USD"),
 }
 
+# Empty/sentinel markers HUD uses for missing rents; hashed lookup beats the
+# linear tuple scan this check runs five times per record.
+_EMPTY = frozenset({None, "", "NA", "N/A"})
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,7 +62,7 @@ def _to_hud_entityid(geo: str) -> str:
     Accepts '49-035', '49035', 'county:4903599999', or '4903599999'
     and returns the 10-digit HUD entity id (county FIPS padded with 9s).
     """
-    s = re.sub(r"\D", "", geo or "")
+    s = _NON_DIGIT.sub("", geo or "")
     if len(s) == 5:
         return (s + "9999").ljust(10, "9")
     if len(s) == 10 and s.endswith("9999"):
@@ -69,12 +77,15 @@ def _iter_fmr_values(record: Mapping[str, Any]) -> Iterable[tuple[str, str, floa
     """
     # 1) Nested basicdata (current API)
     basic = record.get("basicdata")
-    if isinstance(basic, Mapping):
+    if isinstance(basic, dict):
         for hud_key, (metric, unit) in HUD_BASICDATA_FIELDS.items():
             raw_value = basic.get(hud_key)
-            if raw_value in (None, "", "NA", "N/A"):
-                continue
+            # Inside the try: unhashable values (lists, dicts) raise
+            # TypeError on the membership test and should skip the field,
+            # not abort the fetch.
             try:
+                if raw_value in _EMPTY:
+                    continue
                 yield metric, unit, float(raw_value)
             except (TypeError, ValueError):
                 continue
@@ -83,28 +94,67 @@ def _iter_fmr_values(record: Mapping[str, Any]) -> Iterable[tuple[str, str, floa
     # 2) Flat shape fallback: keys like 'fmr_2br' at top level
     for metric, (field_name, unit) in HUD_FMR_FIELDS.items():
         raw_value = record.get(field_name)
-        if raw_value in (None, "", "NA", "N/A"):
-            continue
         try:
+            if raw_value in _EMPTY:
+                continue
             yield metric, unit, float(raw_value)
         except (TypeError, ValueError):
             continue
 
 
+def _normalize_records(payload: Any) -> list[dict[str, Any]]:
+    """Normalize a HUD payload into a list of record dicts.
+
+    Structural pattern matching dispatches on the payload shape in one pass;
+    the JSON decoder only produces plain dicts, so concrete ``dict`` checks
+    are safe and cheaper than the ``Mapping`` ABC.
+    """
+
+    match payload:
+        case {"data": list() as records}:
+            return [record for record in records if isinstance(record, dict)]
+        case {"data": dict() as record}:
+            return [record]
+        case {"data": _}:
+            return []
+        case dict():
+            return [payload]
+        case list():
+            return [record for record in payload if isinstance(record, dict)]
+        case _:
+            return []
+
+
+@lru_cache(maxsize=32)
+def _january_first(year: int) -> datetime:
+    """Shared UTC January 1 timestamp; bulk runs hit the same few years."""
+
+    return datetime(year, 1, 1, tzinfo=UTC)
+
+
 def _extract_geo_name(record: Mapping[str, Any]) -> str | None:
-    # Prefer the richer labels HUD returns
-    candidates = []
-    for key in ("area_name", "metro_name", "county_name", "cbsa_name", "county", "name"):
-        val = record.get(key)
-        if isinstance(val, str) and val.strip():
-            candidates.append(val.strip())
-    state = record.get("state")
-    if isinstance(state, str) and state.strip():
-        candidates.append(state.strip())
-    if candidates:
-        # maintain order, remove duplicates
-        return ", ".join(dict.fromkeys(candidates))
-    return None
+    # Prefer the richer labels HUD returns. Single pass with a seen-set
+    # guard: de-duping inline beats building a list plus a dict.fromkeys
+    # pass when records typically carry only two or three usable names.
+    seen: set[str] = set()
+    parts: list[str] = []
+    get = record.get
+    for key in (
+        "area_name",
+        "metro_name",
+        "county_name",
+        "cbsa_name",
+        "county",
+        "name",
+        "state",
+    ):
+        value = get(key)
+        if isinstance(value, str):
+            value = value.strip()
+            if value and value not in seen:
+                seen.add(value)
+                parts.append(value)
+    return ", ".join(parts) if parts else None
 
 
 async def fetch_hud_fmr(
@@ -114,7 +164,7 @@ async def fetch_hud_fmr(
     year: int,
     token: str | None = None,
     params: Mapping[str, Any] | None = None,
-) -> list[MarketSignal]:
+) -> list[RawSignal]:
     """Fetch HUD Fair Market Rent data for a geography and normalize it."""
     resolved_token = _resolve_token(token)
     if not resolved_token:
@@ -149,24 +199,11 @@ async def fetch_hud_fmr(
         )
         return []
 
-    # Normalize payload into a list of mapping records
-    records: list[Mapping[str, Any]]
-    if isinstance(payload, Mapping):
-        candidate = payload.get("data", payload)
-        if isinstance(candidate, Mapping):
-            records = [candidate]
-        elif isinstance(candidate, list):
-            records = [rec for rec in candidate if isinstance(rec, Mapping)]
-        else:
-            records = []
-    elif isinstance(payload, list):
-        records = [rec for rec in payload if isinstance(rec, Mapping)]
-    else:
-        records = []
+    records = _normalize_records(payload)
 
     # Observed timestamp: prefer response year if present in basicdata, else parameter year
     resp_year = None
-    if records and isinstance(records[0].get("basicdata"), Mapping):
+    if records and isinstance(records[0].get("basicdata"), dict):
         try:
             resp_year = int(records[0]["basicdata"].get("year") or year)
         except (TypeError, ValueError):
@@ -174,14 +211,16 @@ async def fetch_hud_fmr(
     else:
         resp_year = year
 
-    observed_at = datetime(resp_year, 1, 1, tzinfo=UTC)
+    observed_at = _january_first(resp_year)
 
-    signals: list[MarketSignal] = []
+    signals: list[RawSignal] = []
     for record in records:
         geo_name = _extract_geo_name(record) or hud_entity
         for metric, unit, value in _iter_fmr_values(record):
             signals.append(
-                MarketSignal(
+                # Values are already coerced to float; the slots dataclass
+                # skips pydantic construction entirely.
+                RawSignal(
                     source="hud_fmr",
                     geo_level=geo_level,
                     geo_id=entity_id,
@@ -197,4 +236,27 @@ async def fetch_hud_fmr(
     return signals
 
 
-__all__ = ["fetch_hud_fmr", "HUD_FMR_BASE_URL", "HUD_FMR_FIELDS"]
+async def fetch_hud_fmr_many(
+    entity_ids: Iterable[str],
+    *,
+    geo_level: str,
+    year: int,
+    concurrency: int = 8,
+    **kwargs: Any,
+) -> list[list[RawSignal]]:
+    """Fetch FMR data for several geographies concurrently under a cap.
+
+    Keyword arguments are forwarded to ``fetch_hud_fmr``; results come back
+    in the order the entity ids were given.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(entity_id: str) -> list[RawSignal]:
+        async with semaphore:
+            return await fetch_hud_fmr(entity_id, geo_level=geo_level, year=year, **kwargs)
+
+    return await asyncio.gather(*(_one(entity_id) for entity_id in entity_ids))
+
+
+__all__ = ["fetch_hud_fmr", "fetch_hud_fmr_many", "HUD_FMR_BASE_URL", "HUD_FMR_FIELDS"]
@@ -4,17 +4,50 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
 import duckdb
+import pyarrow as pa
 
-from pipelines.model import MarketSignal
+from pipelines.model import MarketSignal, RawSignal
+
+# orjson emits UTF-8 bytes, which Arrow accepts directly when building a
+# string column; keeping them undecoded skips a per-row bytes->str copy.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _dumps = json.dumps
+    _loads = json.loads
 
 DB_ENV_VAR = "MARKET_SIGNALS_DB_PATH"
 DEFAULT_DB_PATH = Path("data/market_signals.duckdb")
 
 MARKET_SIGNALS_TABLE = "market_signals"
+MARKET_SIGNALS_COLUMNS = (
+    "source",
+    "geo_level",
+    "geo_id",
+    "geo_name",
+    "observed_at",
+    "metric",
+    "value",
+    "unit",
+    "raw_payload",
+)
+
+# Constant statement text; DuckDB's Python API has no explicit prepare(), so a
+# stable string is the closest we get to a reusable prepared statement.
+_INSERT_SIGNALS_SQL = (
+    f"INSERT OR REPLACE INTO {MARKET_SIGNALS_TABLE}"
+    f" ({', '.join(MARKET_SIGNALS_COLUMNS)})"
+    " SELECT * FROM _staging_signals"
+)
 
 
 def _ensure_parent_dir(path: Path) -> None:
@@ -49,6 +82,41 @@ def connect(
     return conn
 
 
+@contextmanager
+def write_session(
+    path: str | os.PathLike[str] | None = None,
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """Open a read-write connection against a private copy of the database.
+
+    DuckDB allows one writer or many readers on a file, never both, and the
+    API holds a pool of read-only handles open for its whole lifetime — so a
+    writer opening the live file directly fails with a lock error whenever
+    the API is up. Writing through a copy sidesteps the contention: changes
+    land in a staging file next to the live database and are published with
+    an atomic rename on success, at the cost of one file copy per session.
+    Readers pick up the swap on their next connection acquire; a failed
+    session leaves the live file untouched.
+    """
+
+    db_path = get_database_path(path)
+    _ensure_parent_dir(db_path)
+    staging_path = db_path.with_name(db_path.name + ".staging")
+    staging_path.unlink(missing_ok=True)
+    if db_path.exists():
+        shutil.copy2(db_path, staging_path)
+    conn = duckdb.connect(str(staging_path))
+    try:
+        ensure_market_signals_table(conn)
+        yield conn
+    except BaseException:
+        conn.close()
+        staging_path.unlink(missing_ok=True)
+        raise
+    else:
+        conn.close()
+        os.replace(staging_path, db_path)
+
+
 def ensure_market_signals_table(conn: duckdb.DuckDBPyConnection) -> None:
     """Create the canonical storage table if it does not already exist."""
 
@@ -68,40 +136,61 @@ def ensure_market_signals_table(conn: duckdb.DuckDBPyConnection) -> None:
         )
         """
     )
+    # The primary key already indexes (source, geo_level, geo_id, ...), so a
+    # standalone (geo_level, geo_id) index only added a second B-tree update
+    # per insert. Drop it from databases created before this change.
+    conn.execute(f"DROP INDEX IF EXISTS idx_{MARKET_SIGNALS_TABLE}_geo")
     conn.execute(
         f"""
-        CREATE INDEX IF NOT EXISTS idx_{MARKET_SIGNALS_TABLE}_geo
-        ON {MARKET_SIGNALS_TABLE} (geo_level, geo_id)
+        CREATE INDEX IF NOT EXISTS idx_{MARKET_SIGNALS_TABLE}_metric
+        ON {MARKET_SIGNALS_TABLE} (metric)
         """
     )
     conn.execute(
         f"""
-        CREATE INDEX IF NOT EXISTS idx_{MARKET_SIGNALS_TABLE}_metric
-        ON {MARKET_SIGNALS_TABLE} (metric)
+        CREATE INDEX IF NOT EXISTS idx_{MARKET_SIGNALS_TABLE}_observed_at
+        ON {MARKET_SIGNALS_TABLE} (observed_at)
         """
     )
 
 
-def _serialize_signal(signal: MarketSignal) -> tuple:
-    data = signal.model_dump()
-    raw_payload = data.get("raw_payload")
-    return (
-        data["source"],
-        data["geo_level"],
-        data["geo_id"],
-        data["geo_name"],
-        data["observed_at"],
-        data["metric"],
-        data["value"],
-        data["unit"],
-        json.dumps(raw_payload) if raw_payload is not None else None,
-    )
+def _signals_to_arrow(signals: Sequence[MarketSignal | RawSignal]) -> pa.Table:
+    """Build a columnar Arrow table from signals in a single pass."""
+
+    columns: tuple[list, ...] = tuple([] for _ in MARKET_SIGNALS_COLUMNS)
+    sources, geo_levels, geo_ids, geo_names, observed_ats, metrics, values, units, payloads = columns
+    # Read attributes directly; model_dump would allocate and fill a dict per
+    # row only for us to immediately pick the same nine keys back out.
+    for signal in signals:
+        sources.append(signal.source)
+        geo_levels.append(signal.geo_level)
+        geo_ids.append(signal.geo_id)
+        geo_names.append(signal.geo_name)
+        observed_ats.append(signal.observed_at)
+        metrics.append(signal.metric)
+        values.append(signal.value)
+        units.append(signal.unit)
+        raw_payload = signal.raw_payload
+        payloads.append(_dumps(raw_payload) if raw_payload is not None else None)
+    arrays = [pa.array(column) for column in columns[:-1]]
+    # Explicit string type: orjson payloads are bytes and would otherwise
+    # infer a binary column, which DuckDB's JSON cast double-encodes.
+    arrays.append(pa.array(payloads, type=pa.string()))
+    return pa.Table.from_arrays(arrays, names=list(MARKET_SIGNALS_COLUMNS))
 
 
 def upsert_market_signals(
-    conn: duckdb.DuckDBPyConnection, signals: Iterable[MarketSignal]
+    conn: duckdb.DuckDBPyConnection, signals: Iterable[MarketSignal | RawSignal]
 ) -> int:
-    """Insert or replace a batch of ``MarketSignal`` records.
+    """Insert or replace a batch of signal records.
+
+    Accepts the pydantic ``MarketSignal`` model and the ingest-side
+    ``RawSignal`` dataclass interchangeably; both expose the same fields by
+    attribute.
+
+    The batch is staged as an Arrow table and written in a single INSERT so
+    DuckDB ingests it through its zero-copy Arrow path instead of one
+    parameterized statement per row.
 
     Returns
     -------
@@ -109,68 +198,86 @@ def upsert_market_signals(
         Number of records written to the database.
     """
 
-    serialized = [_serialize_signal(signal) for signal in signals]
-    if not serialized:
+    batch = list(signals)
+    if not batch:
         return 0
 
-    conn.executemany(
-        f"""
-        INSERT OR REPLACE INTO {MARKET_SIGNALS_TABLE} (
-            source,
-            geo_level,
-            geo_id,
-            geo_name,
-            observed_at,
-            metric,
-            value,
-            unit,
-            raw_payload
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        serialized,
-    )
-    return len(serialized)
+    # De-duplicate on the primary key before staging, keeping the last
+    # occurrence to match the old executemany semantics. INSERT OR REPLACE
+    # does not document which in-source duplicate wins, and duplicates do
+    # occur on valid input (HUD stamps every record of a multi-record
+    # payload with the same entity id, year, and metrics).
+    deduped = {
+        (s.source, s.geo_level, s.geo_id, s.observed_at, s.metric): s for s in batch
+    }
+    if len(deduped) != len(batch):
+        batch = list(deduped.values())
 
+    staging = _signals_to_arrow(batch)
+    conn.register("_staging_signals", staging)
+    try:
+        conn.execute(_INSERT_SIGNALS_SQL)
+    finally:
+        conn.unregister("_staging_signals")
+    return staging.num_rows
 
-def fetch_market_signals(
+
+def fetch_market_signals_arrow(
     conn: duckdb.DuckDBPyConnection,
     *,
     where: str | None = None,
     params: Sequence[object] | None = None,
+    order_by: str | None = None,
     limit: int | None = None,
-) -> list[MarketSignal]:
-    """Query stored records and reconstruct ``MarketSignal`` models."""
+) -> pa.Table:
+    """Query stored records and return them as a columnar Arrow table."""
 
     sql = f"SELECT * FROM {MARKET_SIGNALS_TABLE}"
+    bound: list[object] = list(params or [])
     if where:
         sql += f" WHERE {where}"
+    if order_by:
+        sql += f" ORDER BY {order_by}"
     if limit is not None:
-        sql += f" LIMIT {limit}"
-    cursor = conn.execute(sql, params or [])
+        sql += " LIMIT ?"
+        bound.append(limit)
+    return conn.execute(sql, bound).to_arrow_table()
+
+
+def fetch_market_signals(
+    conn: duckdb.DuckDBPyConnection,
+    *,
+    where: str | None = None,
+    params: Sequence[object] | None = None,
+    order_by: str | None = None,
+    limit: int | None = None,
+) -> list[MarketSignal]:
+    """Query stored records and reconstruct ``MarketSignal`` models.
+
+    Rows are materialized through Arrow's C conversion and rebuilt with
+    ``model_construct``; the stored values already passed validation on the
+    way in, so re-running pydantic validators per row would be wasted work.
+    """
+
+    table = fetch_market_signals_arrow(
+        conn, where=where, params=params, order_by=order_by, limit=limit
+    )
     results: list[MarketSignal] = []
-    for row in cursor.fetchall():
-        payload = row[8]
-        results.append(
-            MarketSignal(
-                source=row[0],
-                geo_level=row[1],
-                geo_id=row[2],
-                geo_name=row[3],
-                observed_at=row[4],
-                metric=row[5],
-                value=row[6],
-                unit=row[7],
-                raw_payload=json.loads(payload) if isinstance(payload, str) else payload,
-            )
-        )
+    for row in table.to_pylist():
+        payload = row["raw_payload"]
+        if isinstance(payload, str):
+            row["raw_payload"] = _loads(payload)
+        results.append(MarketSignal.model_construct(**row))
     return results
 
 
 __all__ = [
     "connect",
+    "write_session",
     "ensure_market_signals_table",
     "upsert_market_signals",
     "fetch_market_signals",
+    "fetch_market_signals_arrow",
     "MARKET_SIGNALS_TABLE",
     "get_database_path",
 ]
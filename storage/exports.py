@@ -26,17 +26,12 @@ def export_to_csv(
     params: Sequence[Any] | None = None,
     include_header: bool = True,
 ) -> Path:
-    """Materialize query results into a CSV file using DuckDB's COPY command."""
+    """Materialize query results into a CSV file via DuckDB's native writer."""
 
     dest_path = Path(destination)
     _ensure_parent(dest_path)
     sql = query or _default_query()
-    sanitized_path = str(dest_path).replace("'", "''")
-    copy_sql = (
-        f"COPY ({sql}) TO '{sanitized_path}'"
-        f" (FORMAT CSV, HEADER {'TRUE' if include_header else 'FALSE'})"
-    )
-    conn.execute(copy_sql, params or [])
+    conn.sql(sql, params=params or []).write_csv(str(dest_path), header=include_header)
     return dest_path
 
 
@@ -46,18 +41,17 @@ def export_to_parquet(
     *,
     query: str | None = None,
     params: Sequence[Any] | None = None,
+    compression: str = "zstd",
+    row_group_size: int = 100_000,
 ) -> Path:
-    """Export query results to a Parquet file."""
+    """Export query results to a Parquet file via DuckDB's native writer."""
 
     dest_path = Path(destination)
     _ensure_parent(dest_path)
     sql = query or _default_query()
-    sanitized_path = str(dest_path).replace("'", "''")
-    copy_sql = (
-        f"COPY ({sql}) TO '{sanitized_path}'"
-        " (FORMAT PARQUET)"
+    conn.sql(sql, params=params or []).write_parquet(
+        str(dest_path), compression=compression, row_group_size=row_group_size
     )
-    conn.execute(copy_sql, params or [])
     return dest_path
 
 
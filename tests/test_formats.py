@@ -28,6 +28,7 @@ def populated_db(monkeypatch, tmp_path):
                 metric="fmr_2br",
                 value=1350.0,
                 unit="USD",
+                raw_payload={"basicdata": {"Two-Bedroom": "1350", "year": "2025"}},
             ),
             MarketSignal(
                 source="acs",
@@ -101,3 +102,82 @@ def test_signals_parquet(client):
         finally:
             con.close()
     assert count == 3
+
+
+def test_signals_json_include_raw(client):
+    response = client.get(
+        "/signals",
+        params={
+            "market": "salt_lake_county",
+            "format": "json",
+            "include_raw": True,
+            "metric": "fmr_2br",
+        },
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["count"] == 1
+    # The stored payload must come back as a JSON object, not a re-encoded string.
+    assert payload["items"][0]["raw_payload"] == {
+        "basicdata": {"Two-Bedroom": "1350", "year": "2025"}
+    }
+
+
+def test_signals_json_omits_raw_by_default(client):
+    response = client.get(
+        "/signals",
+        params={"market": "salt_lake_county", "format": "json", "metric": "fmr_2br"},
+    )
+
+    assert response.status_code == 200
+    assert "raw_payload" not in response.json()["items"][0]
+
+
+def test_signals_json_keyset_pagination(client):
+    first = client.get("/signals", params={"market": "salt_lake_county", "format": "json", "limit": 2})
+
+    assert first.status_code == 200
+    first_page = first.json()
+    assert first_page["count"] == 2
+    assert first_page["next_cursor"] is not None
+
+    second = client.get(
+        "/signals",
+        params={
+            "market": "salt_lake_county",
+            "format": "json",
+            "limit": 2,
+            "after": first_page["next_cursor"],
+        },
+    )
+
+    assert second.status_code == 200
+    second_page = second.json()
+    assert second_page["count"] == 1
+    assert second_page["next_cursor"] is None
+
+    first_metrics = {item["metric"] for item in first_page["items"]}
+    second_metrics = {item["metric"] for item in second_page["items"]}
+    assert first_metrics.isdisjoint(second_metrics)
+
+
+def test_signals_json_pagination_across_observed_at_ties(client):
+    # Two of the three fixture rows share observed_at=2025-01-01, so paging
+    # one row at a time forces a page boundary inside the tied group; the
+    # composite cursor must not skip the remaining tied rows.
+    params = {"market": "salt_lake_county", "format": "json", "limit": 1}
+    metrics = []
+    cursor = None
+    for _ in range(5):
+        if cursor:
+            params["after"] = cursor
+        response = client.get("/signals", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        metrics.extend(item["metric"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(metrics) == ["fmr_2br", "median_household_income", "unemp_rate"]